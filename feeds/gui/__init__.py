@@ -1,2 +1,2 @@
-from .gui import Gui
+from .gui import Gui, STYLE_SHEET
 from .controller import APP_NAME
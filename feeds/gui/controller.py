@@ -1,58 +1,97 @@
 import logging
 import sys
 import os
-from multiprocessing import Manager
+import queue
 from typing import Optional
 from appdirs import user_data_dir
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import QApplication
 
 import gui
+from .images import thumbnail
 from feeds.model import FeedList, Feed, FeedParseError, EntryCache, Entry
 from feeds import APP_NAME
 
 
+class EntryQueueReader(QThread):
+    """
+    A thread that waits on an entry queue and emits every `Entry` that arrives in batches.
+
+    Each item on the queue is a list of entries. Pushing `None` onto the queue stops the thread.
+    """
+
+    entries_ready = Signal(list)
+
+    def __init__(self, entry_queue: queue.SimpleQueue, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._entry_queue = entry_queue
+
+    def run(self) -> None:
+        """Block on the entry queue, emitting all entries that are available on each wakeup."""
+        while True:
+            batch: Optional[list[Entry]] = self._entry_queue.get()
+            if batch is None:
+                return
+            entries = list(batch)
+            try:
+                while True:
+                    batch = self._entry_queue.get_nowait()
+                    if batch is None:
+                        self.entries_ready.emit(entries)
+                        return
+                    entries.extend(batch)
+            except queue.Empty:
+                pass
+            self.entries_ready.emit(entries)
+
+
 class Controller(QApplication):
     """
     The main interface to this application's GUI.
     This acts as a bridge between the model and the frontend.
     """
 
+    # chromium flags for the entry reader, forced GL compositing is sluggish on Windows
+    WINDOWS_CHROMIUM_FLAGS = "--disable-gpu-compositing --enable-gpu-rasterization --ignore-gpu-blocklist"
+
     def __init__(self) -> None:
+        # web engine flags are read when the application is created
+        if sys.platform == "win32":
+            os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", Controller.WINDOWS_CHROMIUM_FLAGS)
         super().__init__(sys.argv)
 
         data_dir = user_data_dir(APP_NAME, APP_NAME)
         self.data_path = os.path.join(data_dir, "feeds.json")
 
-        self._entry_queue = Manager().Queue()
-        self._cache = EntryCache()
+        self._entry_queue = queue.SimpleQueue()
+        self._cache = EntryCache(thumbnail)
         self._feed_list = FeedList()
         self._feed_list.load(self.data_path, self._entry_queue, self._cache)
+        # styles are compiled once for the application rather than once per widget
+        self.style_sheet = gui.STYLE_SHEET
         self._gui = gui.Gui(self)
 
     def run(self):
         """Run the GUI and enter the application loop. This is a blocking call."""
 
-        # periodically update the entries in the feed list from the entry queue
-        timer = QTimer(self)
-        timer.interval = 20
-        timer.timeout.connect(self.update_entries)
-        timer.start()
+        # update the entries in the GUI as they arrive on the entry queue
+        reader = EntryQueueReader(self._entry_queue, self)
+        reader.entries_ready.connect(self.update_entries)
+        reader.start()
 
         self.exec_()
 
+        self._entry_queue.put(None)
+        reader.wait()
+
         self._feed_list.save(self.data_path)
         self._cache.save()
 
-    
-    def update_entries(self):
-        """Add any entries in the entry queue to the inner `FeedList`."""
-        while self._entry_queue.qsize() != 0:
-            entry: Entry = self._entry_queue.get(block=False)
-            self._gui.add_entry(entry)
-        
-    
+    def update_entries(self, entries: list[Entry]):
+        """Add the given entries that were received from the entry queue to the `Gui`."""
+        self._gui.add_entries(entries)
+
     def add_feed(self, url: str) -> Optional[Feed]:
         """
         Add a `Feed` to the inner `FeedList`.
@@ -1,16 +1,20 @@
 import random
+from typing import Optional
 from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QLabel, QFrame, QWidget, QScrollArea
-from PySide6.QtGui import QCursor, QMouseEvent, QPixmap
-from PySide6.QtCore import Qt, QMargins
+from PySide6.QtGui import QImage, QMouseEvent, QPixmap, QPixmapCache
+from PySide6.QtCore import Qt, QMargins, QPoint, QRect, QSize, QThreadPool, QTimer
 from __feature__ import snake_case, true_property
 
 from feeds.model import Entry, Feed
+from .images import cached_pixmap, ImageDecodeTask, TOP_IMAGE_MAX_WIDTH
 
 
 class EntryList(QScrollArea):
     """A widget for showing every `Entry` in each enabled `Feed`."""
 
     COLUMN_COUNT = 3
+    # widest an entry's top image is shown, top images are stored at up to this width
+    MAX_CARD_WIDTH = TOP_IMAGE_MAX_WIDTH
 
     def __init__(self, parent) -> None:
         """Create a new empty `EntryList`."""
@@ -19,6 +23,13 @@ class EntryList(QScrollArea):
         self.items: dict[str, list[EntryListItem]] = {}
         self._gui = parent
         self.entry_count = 0
+        # number of items in each column, to keep columns balanced without querying the layouts
+        self._column_counts = [0] * EntryList.COLUMN_COUNT
+        # shells released by items that are no longer shown
+        self._shell_pool: list[EntryItemShell] = []
+        # top images are decoded on a pool separate from the global one, which Qt uses to smoothly
+        # scale large images while the GUI thread holds the GIL that the decode tasks need
+        self.decode_pool = QThreadPool(self)
         self.build()
 
     def build(self) -> None:
@@ -38,113 +49,324 @@ class EntryList(QScrollArea):
         self.set_widget(list_widget)
         self.frame_shape = QFrame.NoFrame
         self.widget_resizable = True
+        self.vertical_scroll_bar().valueChanged.connect(self.build_visible_items)
 
     def add_entry(self, entry: Entry):
         """Add an `Entry` and display its information in this `EntryList`"""
-        item = EntryListItem(self, entry)
+        self.add_entries([entry])
+
+    def add_entries(self, entries: list[Entry]):
+        """
+        Add every given `Entry` and display their information in this `EntryList`.
+
+        Updates are disabled while the items are inserted, so each column is laid out once per batch.
+        Each item goes to the column with the fewest items, and each column's new items are shuffled.
+        """
+        list_widget = self.widget()
+        list_widget.updates_enabled = False
         try:
-            self.items[entry.parent_feed.url].append(item)
-        except KeyError:
-            self.items[entry.parent_feed.url] = [item]
-
-        self.entry_count += 1
-
-        column = self.columns[self.entry_count % EntryList.COLUMN_COUNT]
-        if column.count() > 1:
-            column.insert_widget(random.randint(0, column.count() - 1), item)
-        else:
-            column.add_widget(item)
-        item.show() if entry.parent_feed.enabled else item.hide()
-    
+            column_items: list[list[EntryListItem]] = [[] for _ in self.columns]
+            for entry in entries:
+                item = EntryListItem(self, entry)
+                self.items.setdefault(entry.parent_feed.url, []).append(item)
+                self.entry_count += 1
+                column = min(range(EntryList.COLUMN_COUNT), key=self._column_counts.__getitem__)
+                self._column_counts[column] += 1
+                column_items[column].append(item)
+
+            for column, items in zip(self.columns, column_items):
+                # shuffle once per batch so entries of the same feed are mixed together
+                random.shuffle(items)
+                for item in items:
+                    column.add_widget(item)
+                    item.show() if item.entry.parent_feed.enabled else item.hide()
+        finally:
+            list_widget.updates_enabled = True
+            list_widget.update_geometry()
+        # wait for the new items to be laid out before checking which ones are visible
+        QTimer.single_shot(0, self.build_visible_items)
+
+    def build_visible_items(self):
+        """
+        Build every unbuilt `EntryListItem` that is within, or close to, the viewport.
+        Items further away keep their placeholder until they are scrolled into view.
+        """
+        viewport = self.viewport()
+        margin = viewport.height // 2
+        visible_rect = viewport.rect.adjusted(0, -margin, 0, margin)
+
+        built_any = False
+        for items in self.items.values():
+            for item in items:
+                if item.is_built or not item.visible:
+                    continue
+                item_rect = QRect(item.map_to(viewport, QPoint(0, 0)), item.size)
+                if visible_rect.intersects(item_rect):
+                    item.ensure_built()
+                    built_any = True
+
+        # built items change size, which may move other placeholders into view
+        if built_any:
+            QTimer.single_shot(0, self.build_visible_items)
+
+    def resize_event(self, event) -> None:
+        """Build any items that come into view on resize event."""
+        self.build_visible_items()
+        return super().resize_event(event)
+
+    def show_event(self, event) -> None:
+        """
+        Build any items that come into view on show event. Items added or reloaded
+        while this list was hidden are skipped by `EntryList.build_visible_items`.
+        """
+        # wait for the items to be laid out now that the list is shown
+        QTimer.single_shot(0, self.build_visible_items)
+        return super().show_event(event)
+
     def open_entry(self, entry: Entry):
         """Open this entry in the `Gui`."""
         self._gui.open_entry(entry)
     
     def reload_feed(self, feed: Feed):
-        """Reload the entries of the given `Feed`."""
+        """
+        Reload the entries of the given `Feed`.
+        Items of a disabled feed are released, so their widgets can be reused by other items.
+        """
         items = self.items[feed.url]
         for item in items:
-            item.show() if feed.enabled else item.hide()
+            if feed.enabled:
+                item.show()
+            else:
+                item.hide()
+                item.release()
+        QTimer.single_shot(0, self.build_visible_items)
+
+    def make_item_shell(self) -> "EntryItemShell":
+        """Return an unused `EntryItemShell`, reusing a released one if there is any."""
+        if self._shell_pool:
+            return self._shell_pool.pop()
+        return EntryItemShell()
+
+    def release_item_shell(self, shell: "EntryItemShell") -> None:
+        """Clear the given `EntryItemShell` and keep it for reuse by `EntryList.make_item_shell`."""
+        shell.set_parent(None)
+        shell.clear()
+        self._shell_pool.append(shell)
     
 
+class EntryItemShell(QWidget):
+    """
+    The inner widgets of an `EntryListItem`: its top image, title, feed icon and date.
+    Shells are wired up once, and only their contents change when they are reused by another item.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create a new empty `EntryItemShell`."""
+        super().__init__(*args, **kwargs)
+
+        self.image_label = QLabel()
+        self.image_label.alignment = Qt.AlignCenter
+        self.image_label.object_name = "entry_image"
+
+        self.title_label = QLabel()
+        self.title_label.word_wrap = True
+        self.title_label.object_name = "entry_title"
+
+        # subtitle includes the date and an icon of the feed
+        self.icon_label = QLabel()
+
+        self.date_label = QLabel()
+        self.date_label.object_name = "entry_date"
+        self.date_label.word_wrap = True
+
+        subtitle_layout = QHBoxLayout()
+        subtitle_layout.add_widget(self.icon_label)
+        subtitle_layout.add_widget(self.date_label)
+        subtitle_layout.add_stretch(1)
+
+        vertical_layout = QVBoxLayout(self)
+        vertical_layout.contents_margins = QMargins(0, 0, 0, 0)
+        vertical_layout.add_widget(self.image_label)
+        vertical_layout.add_widget(self.title_label)
+        vertical_layout.add_layout(subtitle_layout)
+        vertical_layout.add_stretch(1)
+
+    def clear(self) -> None:
+        """Clear the contents of every label in this shell."""
+        self.image_label.clear()
+        self.title_label.clear()
+        self.icon_label.clear()
+        self.date_label.clear()
+
+
 class EntryListItem(QFrame):
     """A widget for showing a single `Entry` from a `Feed`."""
 
     QSS = """
-        QFrame[objectName^="frame"] {
+        QFrame#entry_item {
             padding: 0.5em; 
             border-radius: 0.5em;
         }
 
-        QFrame[objectName^="frame"]:hover {
+        QFrame#entry_item:hover {
             background-color: #f0f0f0;
         }
+
+        QLabel#entry_image {
+            border-radius: 20px;
+        }
+
+        QLabel#entry_title {
+            font-size: 16px;
+            font-weight: bold;
+        }
+
+        QLabel#entry_date {
+            font-size: 12px;
+        }
     """
 
+    # height reserved for an item before it is built, close to that of a typical built item
+    PLACEHOLDER_HEIGHT = 300
+    # milliseconds without resizing before the top image is smoothly rescaled
+    SMOOTH_RESCALE_DELAY = 120
+
     def __init__(self, parent: EntryList, entry: Entry, *args, **kwargs):
-        """Create a new empty `EntriesView`."""
+        """
+        Create a new `EntryListItem` for an `Entry`. The item's UI is not built
+        until `EntryListItem.ensure_built` is called.
+        """
         super().__init__(parent=parent, *args, **kwargs)
         self.entry = entry
         self.entry_list = parent
+        self.pixmap = None
+        self._shell: Optional[EntryItemShell] = None
+        self._layout: Optional[QVBoxLayout] = None
+        self._rescale_timer: Optional[QTimer] = None
+        self._scaled_size: Optional[QSize] = None
+        self._built = False
+        self.minimum_height = EntryListItem.PLACEHOLDER_HEIGHT
 
-        self.build()
+    @property
+    def is_built(self) -> bool:
+        """Whether the UI of this item has been built."""
+        return self._built
 
-    def build(self) -> None:
-        """Build this widget's UI."""
+    def ensure_built(self) -> None:
+        """
+        Build this widget's UI if it has not been built yet.
+        Items with a top image keep their placeholder height until the image has been decoded and shown.
+        """
+        if not self._built:
+            self._built = True
+            self.build()
+            if not self.entry.top_image:
+                self.minimum_height = 0
 
-        self.entry_image_view = QLabel()
-        self.entry_image_view.alignment = Qt.AlignCenter
-        self.entry_image_view.style_sheet = "border-radius: 20px;"
-        entry_image = self.entry.top_image
-        if entry_image:
-            self.pixmap = QPixmap()
-            self.pixmap.load_from_data(entry_image)
-            self.scale_pixmap()
-        else:
+    def release(self) -> None:
+        """
+        Return this item's widgets to the `EntryList` so they can be reused by another item.
+        The item shows a placeholder until it is built again.
+        """
+        if self._built:
+            self._built = False
+            if self._rescale_timer:
+                self._rescale_timer.stop()
+            self._layout.remove_widget(self._shell)
+            self.entry_list.release_item_shell(self._shell)
+            self._shell = None
             self.pixmap = None
+            self._scaled_size = None
+            self.minimum_height = EntryListItem.PLACEHOLDER_HEIGHT
 
-        title_label = QLabel(self.entry.title)
-        title_label.word_wrap = True
-        title_label.style_sheet = "font-size: 16px; font-weight: bold;"
+    def build(self) -> None:
+        """Build this widget's UI from an `EntryItemShell` provided by the `EntryList`."""
+        if self._layout is None:
+            self._layout = QVBoxLayout(self)
+            self._layout.contents_margins = QMargins(0, 0, 0, 0)
+            self.object_name = "entry_item"
+            self.cursor = Qt.PointingHandCursor
+
+        self._shell = self.entry_list.make_item_shell()
+        self._shell.title_label.text = self.entry.title
+        self._shell.date_label.text = self.entry.date
 
-        # subtitle includes the date and an icon of the feed
-        icon_label = QLabel()
         icon_image = self.entry.icon
         if icon_image:
-            pixmap = QPixmap()
-            pixmap.load_from_data(icon_image)
-            icon_label.pixmap = pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            key = f"icon:{self.entry.parent_feed.url}:20"
+            self._shell.icon_label.pixmap = cached_pixmap(key, icon_image, 20, 20)
 
-        subtitle_label = QLabel(self.entry.date)
-        subtitle_label.style_sheet = "font-size: 12px"
-        subtitle_label.word_wrap = True
-
-        subtitle_layout = QHBoxLayout()
-        subtitle_layout.add_widget(icon_label)
-        subtitle_layout.add_widget(subtitle_label)
-        subtitle_layout.add_stretch(1)
+        entry_image = self.entry.top_image
+        if entry_image:
+            # while resizing, the image is quickly rescaled, then smoothly rescaled after the resize settles
+            if self._rescale_timer is None:
+                self._rescale_timer = QTimer(self)
+                self._rescale_timer.interval = EntryListItem.SMOOTH_RESCALE_DELAY
+                self._rescale_timer.timeout.connect(self._smooth_rescale)
 
-        vertical_layout = QVBoxLayout(self)
-        vertical_layout.contents_margins = QMargins(0, 0, 0, 0)
-        vertical_layout.add_widget(self.entry_image_view)
-        vertical_layout.add_widget(title_label)
-        vertical_layout.add_layout(subtitle_layout)
-        vertical_layout.add_stretch(1)
+            # decode off the GUI thread, the image is shown once it is ready
+            max_size = QSize(EntryList.MAX_CARD_WIDTH, EntryList.MAX_CARD_WIDTH)
+            task = ImageDecodeTask(entry_image, max_size)
+            task.signals.finished.connect(self._set_top_image)
+            self.entry_list.decode_pool.start(task)
 
-        self.object_name = "frame"
-        self.style_sheet = EntryListItem.QSS
-        self.cursor = QCursor(Qt.PointingHandCursor)
+        self._layout.add_widget(self._shell)
+        self._shell.show()
     
-    def scale_pixmap(self):
-        """Scale the pixmap of this item, if it exists, to the proper size."""
+    def _set_top_image(self, image: QImage):
+        """Show the decoded top image of this item's `Entry`, unless the item was released in the meantime."""
+        if not self._built:
+            return
+        if not image.is_null():
+            self.pixmap = QPixmap.from_image(image)
+            self.scale_pixmap()
+        self.minimum_height = 0
+        # the item is now its built size, which may move other placeholders into view
+        QTimer.single_shot(0, self.entry_list.build_visible_items)
+
+    def _target_size(self) -> QSize:
+        """The size that the top image of this item should fit within."""
         scale_factor = EntryList.COLUMN_COUNT + 0.5
+        target_size = self.parent_widget().size / scale_factor
+        return QSize(min(target_size.width(), EntryList.MAX_CARD_WIDTH), target_size.height())
+
+    def _cache_key(self, size: QSize) -> str:
+        """The `QPixmapCache` key of this item's top image, smoothly scaled to the given size."""
+        return f"top:{self.entry.link}:{size.width()}x{size.height()}"
+
+    def scale_pixmap(self):
+        """Smoothly scale the pixmap of this item, if it exists, to the proper size."""
         if self.pixmap:
-            self.entry_image_view.pixmap = self.pixmap.scaled(
-                self.parent_widget().size / scale_factor, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            target_size = self._target_size()
+            key = self._cache_key(target_size)
+            pixmap = QPixmap()
+            if not QPixmapCache.find(key, pixmap):
+                pixmap = self.pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert(key, pixmap)
+            self._shell.image_label.pixmap = pixmap
+            self._scaled_size = target_size
 
-    def resize_event(self, event) -> None:
-        """Resize the pixmap on resize event."""
+    def _smooth_rescale(self):
+        """Smoothly rescale the pixmap once resizing has settled."""
+        self._rescale_timer.stop()
         self.scale_pixmap()
+
+    def resize_event(self, event) -> None:
+        """
+        Resize the pixmap on resize event. The pixmap is quickly rescaled unless a smoothly
+        scaled one is cached, and a smooth rescale is scheduled for when resizing stops.
+        """
+        if self._built and self.pixmap:
+            target_size = self._target_size()
+            if target_size != self._scaled_size:
+                pixmap = QPixmap()
+                if QPixmapCache.find(self._cache_key(target_size), pixmap):
+                    self._rescale_timer.stop()
+                else:
+                    pixmap = self.pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.FastTransformation)
+                    self._rescale_timer.start()
+                self._shell.image_label.pixmap = pixmap
+                self._scaled_size = target_size
         return super().resize_event(event)
 
     def mouse_press_event(self, event: QMouseEvent) -> None:
@@ -1,3 +1,7 @@
+import functools
+import json
+import shiboken6
+
 from feeds.model import Entry
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QPushButton
@@ -10,7 +14,6 @@ from __feature__ import snake_case, true_property
 
 
 ARTICLE_CSS = """
-    <style>
     body {
         font-family: Helvetica, sans-serif;
         padding-left: 10em;
@@ -47,16 +50,43 @@ ARTICLE_CSS = """
         color: black;
         background: gold;
     }
+"""
 
-    </style>
+# script that attaches the article stylesheet to every document, once injected into a web engine profile
+ARTICLE_CSS_SCRIPT = f"""
+(function () {{
+    var style = document.createElement("style");
+    style.textContent = {json.dumps(ARTICLE_CSS)};
+    function attach() {{
+        (document.head || document.documentElement).appendChild(style);
+    }}
+    if (document.documentElement) {{
+        attach();
+    }} else {{
+        document.addEventListener("readystatechange", attach, {{ once: true }});
+    }}
+}})();
 """
 
 
+@functools.lru_cache(maxsize=64)
+def _compose_document(top_image_url: str, title: str, html: str) -> str:
+    """
+    Compose the HTML document shown by the `EntryReader` for an article.
+    Documents of recently opened entries are cached, so reopening an entry doesn't rebuild its document.
+
+    The document does not include `ARTICLE_CSS`, which is injected by `ARTICLE_CSS_SCRIPT` instead.
+    The top image is left out when the entry has no top image URL.
+    """
+    top_image_html = f"<img src=\"{top_image_url}\">" if top_image_url else ""
+    return f"{top_image_html}<h1 class=\"article-title\">{title}</h1>{html}"
+
+
 class EntryReader(QWidget):
     """A reader for `Entry` HTML content."""
 
     BUTTON_QSS = """
-        QPushButton { 
+        QPushButton#reader_button {
             background-color: #eee;
             padding: 0.25em;
             font-size: 16px;
@@ -65,7 +95,7 @@ class EntryReader(QWidget):
             border-radius: 8px;
         }
 
-        QPushButton:hover {
+        QPushButton#reader_button:hover {
             background-color: #ddd
         }
     """
@@ -82,12 +112,12 @@ class EntryReader(QWidget):
         """Build this widget's UI."""
 
         open_browser_button = QPushButton("Open in Browser")
-        open_browser_button.style_sheet = self.BUTTON_QSS
+        open_browser_button.object_name = "reader_button"
         open_browser_button.cursor = Qt.PointingHandCursor
         open_browser_button.clicked.connect(lambda: self.open_external(self.current_entry.link))
 
         back_button = QPushButton("Back")
-        back_button.style_sheet = self.BUTTON_QSS
+        back_button.object_name = "reader_button"
         back_button.cursor = Qt.PointingHandCursor
         back_button.clicked.connect(self.back)
 
@@ -96,26 +126,35 @@ class EntryReader(QWidget):
         options_layout.add_stretch(1)
         options_layout.add_widget(open_browser_button)
 
+        # one page is kept for the reader's lifetime, so its renderer is reused between entries
         self.web_view = QWebEngineView()
+        self._page = RedirectingPage(self, self._gui.web_profile, parent=self.web_view)
+        self.web_view.set_page(self._page)
 
         layout = QVBoxLayout(self)
         layout.add_layout(options_layout)
         layout.add_widget(self.web_view)
 
+    def delete_web_view(self) -> None:
+        """
+        Delete the web view of this reader along with its page. QtWebEngine requires pages to be
+        deleted before their profile, so this is called by the `Gui` before its profile is deleted.
+        """
+        if self.web_view is not None:
+            shiboken6.delete(self.web_view)
+            self.web_view = None
+            self._page = None
+
     def open_entry(self, entry: Entry):
         """Show the given `Entry` in this `EntryReader`."""
-        self.web_view.set_page(RedirectingPage(self, parent=self.web_view))
         self.current_entry = entry
-        top_image_html = f"<img src=\"{entry.top_image_url}\">"
-        title_html = f"<h1 class=\"article-title\">{entry.title}</h1>"
-        self.web_view.set_html(ARTICLE_CSS + top_image_html + title_html + entry.html)
+        self.web_view.set_html(_compose_document(entry.top_image_url, entry.title, entry.html))
     
     def open_external(self, url):
         """Open the given url in the system's default browser."""
         QDesktopServices.open_url(url)
     
     def back(self):
-        self.web_view.page().delete_later()
         self._gui.back()
 
 
@@ -1,12 +1,13 @@
 from typing import Union
 from PySide6.QtWidgets import (QHBoxLayout, QLabel, QWidget, QPushButton, QVBoxLayout, QInputDialog, QFrame, QScrollArea, 
                                 QDialog, QDialogButtonBox, QCheckBox, QFormLayout, QLineEdit, QMessageBox)
-from PySide6.QtGui import QCursor, QPixmap, QIcon, QMouseEvent, QFont
+from PySide6.QtGui import QPixmap, QPixmapCache, QIcon, QMouseEvent, QFont
 from PySide6.QtCore import Qt, QMargins
 from __feature__ import snake_case, true_property
 
 from feeds.model import Feed, FeedList
 from .controller import Controller
+from .images import cached_pixmap
 
 
 class FeedLibrary(QWidget):
@@ -16,7 +17,7 @@ class FeedLibrary(QWidget):
     """
 
     BUTTON_QSS = """
-        QPushButton { 
+        QPushButton#library_button {
             background-color: #fff;
             padding: 0.25em;
             font-size: 20px;
@@ -25,7 +26,7 @@ class FeedLibrary(QWidget):
             border-radius: 8px;
         }
 
-        QPushButton:hover {
+        QPushButton#library_button:hover {
             background-color: #ddd
         }
     """
@@ -39,8 +40,8 @@ class FeedLibrary(QWidget):
     def build(self) -> None:
         """Build this widget's UI."""
         add_button = QPushButton("\uFF0B Add Feed")
-        add_button.style_sheet = FeedLibrary.BUTTON_QSS
-        add_button.cursor = QCursor(Qt.PointingHandCursor)
+        add_button.object_name = "library_button"
+        add_button.cursor = Qt.PointingHandCursor
         add_button.clicked.connect(self._add_feed)
 
         scroll_area = QScrollArea(self)
@@ -105,7 +106,6 @@ class FeedItem(QFrame):
         """Build this widget's UI."""
         self.object_name = "feed_item"
         self.cursor = Qt.PointingHandCursor
-        self.style_sheet = self.QSS
 
         layout = QHBoxLayout(self)
         layout.contents_margins = QMargins(0, 0, 0, 0)
@@ -120,14 +120,15 @@ class FeedItem(QFrame):
         self.icon_label = QLabel()
         icon_image = self._feed.icon
         if icon_image:
-            self.pixmap = QPixmap()
-            self.pixmap.load_from_data(icon_image)
-
-            self.icon = QIcon()
-            self.icon.add_pixmap(self.pixmap.scaled(
-                32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation), QIcon.Active, QIcon.On)
-            self.grayed_pixmap = self.icon.pixmap(
-                self.pixmap.size(), QIcon.Disabled, QIcon.On)
+            self.pixmap = cached_pixmap(f"icon:{self._feed.url}:32", icon_image, 32, 32)
+
+            gray_key = f"icon_gray:{self._feed.url}:32"
+            self.grayed_pixmap = QPixmap()
+            if not QPixmapCache.find(gray_key, self.grayed_pixmap):
+                icon = QIcon()
+                icon.add_pixmap(self.pixmap, QIcon.Active, QIcon.On)
+                self.grayed_pixmap = icon.pixmap(self.pixmap.size(), QIcon.Disabled, QIcon.On)
+                QPixmapCache.insert(gray_key, self.grayed_pixmap)
             self.update()
 
         layout.add_widget(self.icon_label)
@@ -1,19 +1,29 @@
 import logging
+import os
 import sys
 sys.path.append(".")
 
+from appdirs import user_cache_dir
+
+from feeds import APP_NAME
 from feeds.model import Entry, Feed
-from .feed_library import FeedLibrary
-from .entry_reader import EntryReader
-from .entry_list import EntryList
+from .feed_library import FeedLibrary, FeedItem
+from .entry_reader import EntryReader, ARTICLE_CSS_SCRIPT
+from .entry_list import EntryList, EntryListItem
 from .controller import Controller
+from .images import PIXMAP_CACHE_LIMIT
 
 from PySide6.QtWidgets import QWidget, QStackedWidget, QDockWidget, QMainWindow, QApplication
-from PySide6.QtGui import QPalette
+from PySide6.QtGui import QPalette, QPixmapCache
+from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEngineScript
 from PySide6.QtCore import Qt
 from __feature__ import snake_case, true_property
 
 
+# style sheet for the whole application, widgets are styled by their object names
+STYLE_SHEET = FeedLibrary.BUTTON_QSS + FeedItem.QSS + EntryReader.BUTTON_QSS + EntryListItem.QSS
+
+
 class Gui(QMainWindow):
     """
     The main GUI object that displays app state.
@@ -23,6 +33,9 @@ class Gui(QMainWindow):
     return information on whether to redraw, and any other contextual information.
     """
 
+    # maximum size of the entry reader's disk cache, in bytes
+    WEB_CACHE_SIZE = 200 * 1024 * 1024
+
     def __init__(self, controller: Controller, *args, **kwargs):
         """
         Build and initialize a new `Gui` with the given `FeedList`. This will show the 
@@ -30,11 +43,28 @@ class Gui(QMainWindow):
         """
         super().__init__(*args, **kwargs)
         self._controller = controller
+        QPixmapCache.set_cache_limit(PIXMAP_CACHE_LIMIT)
 
         # resize to slightly smaller than screen
         self.resize(QApplication.primary_screen.size / 1.2)
         self.window_title = "Feeds"
 
+        # persistent profile for the entry reader, so article images and styles are cached on disk
+        # the profile is owned by the window, the entry reader's page is deleted before it on close
+        self.web_profile = QWebEngineProfile(APP_NAME, self)
+        self.web_profile.set_http_cache_type(QWebEngineProfile.DiskHttpCache)
+        self.web_profile.set_cache_path(os.path.join(user_cache_dir(APP_NAME, APP_NAME), "webcache"))
+        self.web_profile.set_http_cache_maximum_size(Gui.WEB_CACHE_SIZE)
+
+        # style every article when its document is created, rather than sending the stylesheet with it
+        style_script = QWebEngineScript()
+        style_script.set_name("article-css")
+        style_script.set_source_code(ARTICLE_CSS_SCRIPT)
+        style_script.set_injection_point(QWebEngineScript.DocumentCreation)
+        style_script.set_world_id(QWebEngineScript.MainWorld)
+        style_script.set_runs_on_sub_frames(False)
+        self.web_profile.scripts().insert(style_script)
+
         self.entry_reader = EntryReader(self)
 
         self.entry_list = EntryList(self)
@@ -64,6 +94,13 @@ class Gui(QMainWindow):
         The entry should be fully downloaded and parsed.
         """
         self.entry_list.add_entry(entry)
+
+    def add_entries(self, entries: list[Entry]):
+        """
+        Add every given `Entry` to the GUI's `EntryList` in a single batch.
+        The entries should be fully downloaded and parsed.
+        """
+        self.entry_list.add_entries(entries)
     
     def open_entry(self, entry: Entry):
         """Open the `EntryReader` and display the given `Entry`."""
@@ -82,3 +119,8 @@ class Gui(QMainWindow):
 
     def back(self) -> None:
         self.stacked_widget.current_index = 0
+
+    def close_event(self, event) -> None:
+        """Delete the entry reader's page on close event, so that it is deleted before the web profile."""
+        self.entry_reader.delete_web_view()
+        return super().close_event(event)
@@ -0,0 +1,102 @@
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+from PySide6.QtCore import Qt, QBuffer, QByteArray, QIODevice, QObject, QRunnable, QSize, Signal
+from __feature__ import snake_case, true_property
+
+
+# size limit of the global pixmap cache, in kilobytes
+PIXMAP_CACHE_LIMIT = 51200
+# top images are downscaled to this width when entries are downloaded, the largest an entry card will show them at
+TOP_IMAGE_MAX_WIDTH = 512
+
+
+def thumbnail(image: bytes, max_width: int = TOP_IMAGE_MAX_WIDTH) -> bytes:
+    """
+    Return the given image data downscaled to be at most `max_width` pixels wide.
+    Images that are already small enough, or that cannot be decoded, are returned unchanged.
+    """
+    source = QBuffer()
+    source.set_data(image)
+    source.open(QIODevice.ReadOnly)
+    reader = QImageReader(source)
+    size = reader.size()
+    if not size.is_valid() or size.width() <= max_width:
+        return image
+
+    # decode straight to the smaller size, which is much cheaper than decoding at full size for JPEGs
+    reader.set_scaled_size(size.scaled(max_width, size.height(), Qt.KeepAspectRatio))
+    scaled = reader.read()
+    if scaled.is_null():
+        return image
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    # keep transparency for images that have it, everything else is stored as a compact JPEG
+    if scaled.has_alpha_channel():
+        scaled.save(buffer, "PNG")
+    else:
+        scaled.save(buffer, "JPG", 80)
+    buffer.close()
+    return data.data()
+
+
+def read_image(data: bytes, size: QSize) -> QImage:
+    """
+    Decode the image data into a `QImage`, scaled down to fit within the given size if it is larger.
+
+    The image is scaled while it is read, which lets formats such as JPEG decode at a reduced
+    resolution instead of decoding the full image first. A null `QImage` is returned if decoding fails.
+    """
+    buffer = QBuffer()
+    buffer.set_data(data)
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    image_size = reader.size()
+    if image_size.is_valid() and (image_size.width() > size.width() or image_size.height() > size.height()):
+        reader.set_scaled_size(image_size.scaled(size, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def cached_pixmap(key: str, data: bytes, width: int, height: int) -> QPixmap:
+    """
+    Return a `QPixmap` of the image data scaled to fit within the given size.
+
+    Scaled pixmaps are stored in the global `QPixmapCache` under the given key, so
+    images shared between widgets (such as feed icons) are only decoded and scaled once.
+    """
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+
+    pixmap = QPixmap.from_image(read_image(data, QSize(width, height)))
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class ImageDecodeSignals(QObject):
+    """Signals emitted by an `ImageDecodeTask`."""
+
+    finished = Signal(QImage)
+
+
+class ImageDecodeTask(QRunnable):
+    """
+    A task that decodes image data into a `QImage` on a `QThreadPool` thread.
+
+    `QPixmap` can only be used on the GUI thread, so receivers of `ImageDecodeSignals.finished`
+    should convert the decoded image with `QPixmap.from_image`.
+    """
+
+    def __init__(self, data: bytes, target_size: QSize) -> None:
+        """
+        Create a new `ImageDecodeTask` for the given image data.
+        The decoded image is scaled down to fit within the target size, see `read_image`.
+        """
+        super().__init__()
+        self.signals = ImageDecodeSignals()
+        self._data = data
+        self._target_size = target_size
+
+    def run(self) -> None:
+        """Decode the image data and emit the result, which is a null `QImage` if decoding failed."""
+        self.signals.finished.emit(read_image(self._data, self._target_size))
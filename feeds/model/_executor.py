@@ -0,0 +1,9 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+# thread pool shared by every `Feed`, sized for network bound work rather than for the CPU
+EXECUTOR = ThreadPoolExecutor(max_workers=min(64, (os.cpu_count() or 4) * 8), thread_name_prefix="feed-io")
+# separate thread pool for image downloads that `EXECUTOR` tasks wait on, so they can never
+# be queued behind the very tasks that are waiting for them
+IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="feed-image")
@@ -7,12 +7,18 @@ from newspaper import Article
 class Entry:
     """An individual article entry in a `Feed`."""
 
-    def __init__(self, parent, article: Article, entry: dict[str, str], top_image_url: str, top_image: bytes = None, icon_image: bytes = None) -> None:
+    __slots__ = ("_parent_feed", "_title", "_link", "_html", "_top_image", "_top_image_url", "_icon", "_date")
+
+    def __init__(self, parent, article: Article, entry: dict[str, str], top_image_url: str, top_image: bytes = None, icon_image: bytes = None,
+                 now: Optional[datetime.datetime] = None) -> None:
         """
         Create a new `Entry` with a parent `Feed` and with data provided by a
         `newspaper.Article` as well as a `feedparser.FeedParserDict` entry.
 
         Top image url data for the article can be provided as a list of bytes.
+
+        The relative date of the entry is measured from `now`, which should be shared by entries
+        created in the same batch (see `Entry.batch_now`). The current time is used if it is not given.
         """
         self._parent_feed = parent
         self._title = entry.title
@@ -22,27 +28,47 @@ class Entry:
         self._top_image_url = top_image_url
         self._icon = icon_image
 
-        try:
-            date = entry.published_parsed
-        except:
-            try:
-                date = entry.created_parsed
-            except:
-                self._date = ""
-                return
-        self._construct_date(datetime.datetime(*(date[:6])))
-
-    def _construct_date(self, date: datetime.datetime):
-        """Construct the date string for this entry from a `datetime` object"""
-        delta: datetime.timedelta = datetime.datetime.now() - date
-        months = delta.days // 30
-        hours = delta.seconds // 3600
-        minutes = delta.seconds // 60
+        date = getattr(entry, "published_parsed", None) or getattr(entry, "created_parsed", None)
+        if date is None:
+            self._date = ""
+            return
+        date = datetime.datetime(date.tm_year, date.tm_mon, date.tm_mday, date.tm_hour, date.tm_min, date.tm_sec)
+        self._construct_date(date, now or Entry.batch_now())
+
+    def to_tuple(self) -> tuple:
+        """
+        Return the fields of this `Entry` as a tuple of strings and bytes, for serialization.
+        The parent `Feed` and its icon are not included, since they are shared by every entry in the feed.
+        """
+        return (self._title, self._link, self._html, self._top_image, self._top_image_url, self._date)
+
+    @classmethod
+    def from_tuple(cls, fields: tuple, parent=None, icon_image: bytes = None) -> "Entry":
+        """Create an `Entry` with the given parent `Feed` and icon from fields returned by `Entry.to_tuple`."""
+        entry = cls.__new__(cls)
+        entry._parent_feed = parent
+        entry._icon = icon_image
+        (entry._title, entry._link, entry._html, entry._top_image,
+            entry._top_image_url, entry._date) = fields
+        return entry
+
+    @classmethod
+    def batch_now(cls) -> datetime.datetime:
+        """The current time, to be shared by every `Entry` created in a batch."""
+        return datetime.datetime.now()
+
+    def _construct_date(self, date: datetime.datetime, now: datetime.datetime):
+        """Construct the date string for this entry from a `datetime` object, relative to `now`."""
+        total = max(0, int((now - date).total_seconds()))
+        months = total // 2592000
+        days = total // 86400
+        hours = total // 3600
+        minutes = total // 60
         if months > 0:
             value = months
             unit = "month"
-        elif delta.days > 0:
-            value = delta.days
+        elif days > 0:
+            value = days
             unit = "day"
         elif hours > 0:
             value = hours
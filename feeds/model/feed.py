@@ -1,36 +1,125 @@
 import logging
 from pathlib import Path
-import pickle
 import feedparser
-import urllib
+import msgpack
 import os
 import threading
-import json
+import orjson
 import requests
-import concurrent.futures
 
-from multiprocessing import Queue
-from newspaper import Article, Source
-from typing import Optional
+from concurrent.futures import Future
+from itertools import chain
+from urllib.parse import urlparse
+from queue import SimpleQueue
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from newspaper import Article, Config
+from typing import Callable, Mapping, Optional
 from appdirs import user_cache_dir
 
 from .entry import Entry
+from ._executor import EXECUTOR, IMAGE_EXECUTOR
 from feeds import APP_NAME
 
 
+# HTTP session shared by every download, so connections to the same host are reused
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = Config().browser_user_agent
+# gzip and deflate, and brotli when it is installed to decode it
+_SESSION.headers["Accept-Encoding"] = ACCEPT_ENCODING
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+# (connect, read) timeouts in seconds for downloads with `_SESSION`
+_TIMEOUT = (3, 10)
+# images larger than this are not downloaded
+_MAX_IMAGE_BYTES = 4 * 1024 * 1024
+# feed documents larger than this are not downloaded
+_MAX_FEED_BYTES = 8 * 1024 * 1024
+# number of requests that can be made to a single host at once
+_HOST_CONCURRENCY = 4
+_HOST_SEMAPHORES: dict[str, threading.BoundedSemaphore] = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """
+    Return the semaphore that limits concurrent requests to the host of the given URL,
+    so that downloads don't pile up on one server while the executor's workers are free for other hosts.
+    """
+    host = urlparse(url).hostname or ""
+    with _HOST_SEMAPHORES_LOCK:
+        semaphore = _HOST_SEMAPHORES.get(host)
+        if semaphore is None:
+            semaphore = _HOST_SEMAPHORES[host] = threading.BoundedSemaphore(_HOST_CONCURRENCY)
+        return semaphore
+
+
+def _fetch_bytes(url: str, max_bytes: int) -> tuple[Optional[bytes], Mapping[str, str]]:
+    """
+    Return the body and the headers of a response from the given URL with `_SESSION`.
+    The body is `None` if the response is not successful or its body is larger than `max_bytes`.
+
+    The body is streamed, so larger responses are dropped without being read into memory.
+    This will raise a `requests.RequestException` if the request fails.
+    """
+    with _host_semaphore(url), _SESSION.get(url, stream=True, timeout=_TIMEOUT) as r:
+        if r.status_code != 200 or int(r.headers.get("content-length", 0)) > max_bytes:
+            return None, r.headers
+        data = bytearray()
+        for chunk in r.iter_content(chunk_size=65536):
+            data += chunk
+            if len(data) > max_bytes:
+                return None, r.headers
+        return bytes(data), r.headers
+
+
+def _brand_from_host(host: str) -> str:
+    """Return a display name for a site from its hostname, e.g. `www.example.com` becomes `EXAMPLE`."""
+    host = host.removeprefix("www.")
+    return host.split(".")[0].upper()
+
+
 class EntryCache:
-    """A dictionary of cached entries. Each key is an `Entry` link."""
+    """
+    A dictionary of cached entries. Each key is an `Entry` link.
+    Feed icons are also cached in `EntryCache.icons`, keyed by the hostname of the feed's site,
+    and the top images of cached entries in `EntryCache.images`, keyed by their URL.
 
-    def __init__(self) -> None:
+    The cache is stored on disk with msgpack, as a map of `Entry` links to the fields of `Entry.to_tuple`,
+    alongside the map of icons.
+    """
+
+    def __init__(self, thumbnail: Optional[Callable[[bytes], bytes]] = None) -> None:
+        """
+        Create a new `EntryCache`, loaded from the cache directory if a cache was saved before.
+
+        Downloaded top images are passed through `thumbnail` before they are stored, if it is
+        given, so that frontends can downscale them to the largest size they show them at.
+        """
+        self._thumbnail = thumbnail
         self.entries: dict[str, Entry] = {}
         # cache entries that were used from this instance
         self.used: dict[str, Entry] ={}
+        self.icons: dict[str, bytes] = {}
+        self.images: dict[str, bytes] = {}
+        # entries are looked up and inserted from download threads
+        self._lock = threading.Lock()
+        # links being downloaded by a thread that claimed them with `EntryCache.get_or_claim`
+        self._claims: dict[str, threading.Event] = {}
+        # image URLs being downloaded by a thread that claimed them with `EntryCache.get_or_claim_image`
+        self._image_claims: dict[str, threading.Event] = {}
         cache_dir = user_cache_dir(APP_NAME, APP_NAME)
-        self.cache_path = os.path.join(cache_dir, "entries.pickle")
+        self.cache_path = os.path.join(cache_dir, "entries.msgpack")
         try:
+            # the directory is created once here, so that saving only has to write the file
+            Path(cache_dir).mkdir(exist_ok=True, parents=True)
             with open(self.cache_path, "rb") as cache_file:
-                entries: dict[str, Entry] = pickle.load(cache_file)
-                self.entries = entries
+                data = msgpack.unpackb(cache_file.read(), raw=False, use_list=False)
+            self.entries = {link: Entry.from_tuple(fields) for link, fields in data["entries"].items()}
+            self.icons = dict(data.get("icons", {}))
+            # top images are stored with their entries, so they are not saved twice
+            self.images = {entry.top_image_url: entry.top_image
+                           for entry in self.entries.values() if entry.top_image}
         except Exception as e:
             logging.error(f"Failed to load cache file: {e}")
 
@@ -39,12 +128,22 @@ class EntryCache:
         Save this `EntryCache` to a file on disk in the cache directory.
         Only the entries that were retrieved with `EntryCache.get` will be saved in
         the next cache.
+
+        The cache is written to a temporary file that then replaces the previous cache,
+        so an interrupted save never leaves a partially written cache behind.
         """
         try:
-            Path(self.cache_path).parent.mkdir(exist_ok=True, parents=True)
             logging.info(f"saving cache to {self.cache_path}")
-            with open(self.cache_path, "wb+") as cache_file:
-                pickle.dump(self.used, cache_file)
+            with self._lock:
+                data = {
+                    "entries": {link: entry.to_tuple() for link, entry in self.used.items()},
+                    "icons": dict(self.icons)
+                }
+            packed = msgpack.packb(data, use_bin_type=True)
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(packed)
+            os.replace(temp_path, self.cache_path)
         except Exception as e:
             logging.error(f"Failed to save cache to path: {e}")
 
@@ -53,16 +152,156 @@ class EntryCache:
         Get the `Entry` assosciated to the given link.
         Will return `None` if the key does not exist.
         """
-        try:
-            entry = self.entries[link]
-            self.used[link] = entry
+        with self._lock:
+            entry = self.entries.get(link)
+            if entry is not None:
+                self.used[link] = entry
             return entry
-        except KeyError:
-            return None
+
+    def get_or_claim(self, link: str, parent=None, icon_image: bytes = None) -> Optional[Entry]:
+        """
+        Get the `Entry` assosciated to the given link, like `EntryCache.get`, for the given parent `Feed`.
+        A cached entry without a parent is given the parent and its icon. If the entry already belongs
+        to another feed listing the same link, a copy with the given parent and icon is returned instead.
+
+        If the key does not exist, `None` is returned and the link is claimed by the caller, which should
+        download the entry and insert it with `EntryCache.put_used`, or call `EntryCache.release` if that fails.
+        If another thread has already claimed the link, this waits until it has inserted or released it.
+        """
+        while True:
+            with self._lock:
+                entry = self.entries.get(link)
+                if entry is not None:
+                    self.used[link] = entry
+                    if entry.parent_feed is None or entry.parent_feed is parent:
+                        entry._parent_feed = parent
+                        entry._icon = icon_image
+                        return entry
+                    return Entry.from_tuple(entry.to_tuple(), parent, icon_image)
+                claim = self._claims.get(link)
+                if claim is None:
+                    self._claims[link] = threading.Event()
+                    return None
+            claim.wait()
+
+    def release(self, link: str) -> None:
+        """Release a link claimed with `EntryCache.get_or_claim` without inserting an entry for it."""
+        with self._lock:
+            claim = self._claims.pop(link, None)
+        if claim:
+            claim.set()
 
     def put(self, link: str, entry: Entry) -> None:
         """Insert a new link-entry pair into the cache."""
-        self.entries[link] = entry
+        with self._lock:
+            self.entries[link] = entry
+
+    def thumbnail(self, image: bytes) -> bytes:
+        """Return the given downloaded top image data as it should be stored in the cache."""
+        return self._thumbnail(image) if self._thumbnail else image
+
+    def get_or_claim_image(self, url: str) -> Optional[bytes]:
+        """
+        Get the top image data stored for the given URL in `EntryCache.images`.
+
+        If there is none, `None` is returned and the URL is claimed by the caller, which should download
+        the image and call `EntryCache.put_image`, even if the download fails. If another thread has already
+        claimed the URL, this waits until it has put the image, so a shared image is only downloaded once.
+        """
+        while True:
+            with self._lock:
+                image = self.images.get(url)
+                if image is not None:
+                    return image
+                claim = self._image_claims.get(url)
+                if claim is None:
+                    self._image_claims[url] = threading.Event()
+                    return None
+            claim.wait()
+
+    def put_image(self, url: str, image: Optional[bytes]) -> None:
+        """
+        Insert the top image data for the given URL into `EntryCache.images`, and release the URL
+        if it was claimed with `EntryCache.get_or_claim_image`. Nothing is inserted if `image` is `None`.
+        """
+        with self._lock:
+            if image:
+                self.images[url] = image
+            claim = self._image_claims.pop(url, None)
+        if claim:
+            claim.set()
+
+    def get_icon(self, host: str) -> Optional[bytes]:
+        """
+        Get the icon of the site with the given hostname.
+        Will return `None` if the icon is not cached.
+        """
+        with self._lock:
+            return self.icons.get(host)
+
+    def put_icon(self, host: str, icon: bytes) -> None:
+        """Insert the icon of the site with the given hostname into the cache."""
+        with self._lock:
+            self.icons[host] = icon
+
+    def put_used(self, link: str, entry: Entry) -> None:
+        """
+        Insert a new link-entry pair into the cache, and mark it as used
+        so that it will be saved with the cache. The entry's top image is added to `EntryCache.images`.
+
+        If the link was claimed with `EntryCache.get_or_claim`, it is released.
+        """
+        with self._lock:
+            self.entries[link] = entry
+            self.used[link] = entry
+            if entry.top_image:
+                self.images[entry.top_image_url] = entry.top_image
+            claim = self._claims.pop(link, None)
+        if claim:
+            claim.set()
+
+
+class _EntryBatcher:
+    """
+    Collects entries from download threads and pushes them onto an entry queue in lists.
+
+    A list is pushed once it holds `BATCH_SIZE` entries, or `BATCH_DELAY` seconds after
+    its first entry was added, whichever comes first.
+    """
+
+    BATCH_SIZE = 8
+    BATCH_DELAY = 0.1
+
+    def __init__(self, queue: SimpleQueue) -> None:
+        self._queue = queue
+        self._lock = threading.Lock()
+        self._batch: list[Entry] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, entry: Entry) -> None:
+        """Add an `Entry` to the current batch."""
+        with self._lock:
+            self._batch.append(entry)
+            if len(self._batch) >= _EntryBatcher.BATCH_SIZE:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(_EntryBatcher.BATCH_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Push the current batch onto the queue, if it has any entries."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Push the current batch onto the queue. The lock must be held by the caller."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = []
 
 
 class FeedParseError(Exception):
@@ -73,73 +312,197 @@ class FeedParseError(Exception):
 class Feed:
     """An RSS/Atom feed."""
 
-    def __init__(self, url: str, entry_queue: Queue, cache: EntryCache, display=None, enabled=True) -> None:
+    def __init__(self, url: str, entry_queue: SimpleQueue, cache: EntryCache, display=None, enabled=True,
+                 bootstrap=True) -> None:
         """
         Create a new `Feed` given a feed's URL. This is a blocking network call.
-        An entry queue should be passed. Each `Entry` that has finished downloading its
-        content will be pushed onto this `Queue`.
+        An entry queue should be passed. Entries that have finished downloading their
+        content will be pushed onto this queue in lists.
 
         This will throw a `FeedParseError` if the feed at the given url cannot be parsed.
+
+        If `bootstrap` is `False`, this returns immediately without parsing the feed,
+        and `Feed.bootstrap` must be called before the `Feed` is used.
         """
         self._url = url
         self._enabled = enabled
+        self._display = display
+        self._icon: Optional[bytes] = None
         self._entries: list[Entry] = []
+        self._entry_queue = entry_queue
+        self._cache = cache
+
+        if bootstrap:
+            self.bootstrap()
 
+    def bootstrap(self) -> "Feed":
+        """
+        Parse this `Feed`, get its icon, and start downloading its entries. This is a blocking network call,
+        which can be run on another thread to create many feeds at once. Returns this `Feed`.
+
+        This will throw a `FeedParseError` if the feed cannot be parsed.
+        """
         try:
-            self._feed: feedparser.FeedParserDict = feedparser.parse(url)
+            # the feed is downloaded with the shared session rather than by feedparser, the URL and the
+            # headers feedparser would have used are passed along, to resolve relative links and detect the encoding
+            content, headers = _fetch_bytes(self._url, _MAX_FEED_BYTES)
+            if content is None:
+                raise FeedParseError(
+                    f"Failed to download feed from {self._url}, or it is larger than {_MAX_FEED_BYTES} bytes")
+            response_headers = {"content-location": self._url}
+            # the content is already decompressed, so content-encoding is left out
+            for header in ("content-type", "content-language", "etag", "last-modified"):
+                if header in headers:
+                    response_headers[header] = headers[header]
+            self._feed: feedparser.FeedParserDict = feedparser.parse(content, response_headers=response_headers)
             first_link = self._feed.entries[0].link
-            root_link = urllib.request.urlparse(first_link).hostname
-            self._display = display if display else Source(first_link).brand.upper()
-            # icon image using google's favicons API
-            icon_url = f"https://www.google.com/s2/favicons?domain={root_link}&sz=32"
-            self._icon = self._download_image(icon_url)
+            root_link = urlparse(first_link).hostname
+            if not self._display:
+                self._display = _brand_from_host(root_link)
+            self._icon = self._cache.get_icon(root_link)
+            if self._icon is None:
+                # icon image using google's favicons API
+                icon_url = f"https://www.google.com/s2/favicons?domain={root_link}&sz=32"
+                self._icon = self._download_image(icon_url)
+                if self._icon:
+                    self._cache.put_icon(root_link, self._icon)
+        except FeedParseError:
+            raise
         except Exception as e:
-            raise FeedParseError(f"Failed to parse feed from {url}: {e}")
+            raise FeedParseError(f"Failed to parse feed from {self._url}: {e}")
 
-        threading.Thread(target=self.download_entries, args=(
-            entry_queue, cache), daemon=True).start()
+        self.download_entries(self._entry_queue, self._cache)
+        return self
 
-    def download_entries(self, queue: Queue, cache: EntryCache):
-        """Download every entry for this `Feed`."""
+    def download_entries(self, queue: SimpleQueue, cache: EntryCache):
+        """
+        Download every entry for this `Feed` on the shared executor. This returns immediately.
+
+        Downloaded entries are pushed onto the queue in lists of up to `_EntryBatcher.BATCH_SIZE`
+        entries, and no later than `_EntryBatcher.BATCH_DELAY` seconds after they are downloaded.
+        """
+        now = Entry.batch_now()
+        batcher = _EntryBatcher(queue)
 
-        def download_entry(entry_data: dict[str, str]):
+        def download_entry(entry_data: dict[str, str]) -> Entry:
             """
             Download a single feed entry from the information provided by an entry
             item in a `feedparser.FeedParserDict`.
             """
-            cached = cache.get(entry_data.link)
+            # the link is claimed, so a feed listing the same link waits for this download instead of repeating it
+            cached = cache.get_or_claim(entry_data.link, self, self._icon)
             if cached:
                 logging.info(f"using cached entry {cached.link}")
-                cached._parent_feed = self
                 feed_entry = cached
             else:
-                article = Article(entry_data.link, keep_article_html=True)
-                article.download()
-                article.parse()
-
-                # get images
-                image = self._download_image(article.top_image)
-
-                feed_entry = Entry(self, article, entry_data,
-                              article.top_image, image, self._icon)
-                cache.put(entry_data.link, feed_entry)
-                cache.get(entry_data.link) # force into used list to save afterwards
+                prefetch = None
+                try:
+                    # start downloading the image the feed provides while the article is downloaded,
+                    # it is usually the same as the article's top image
+                    image_hint = self._image_hint(entry_data)
+                    if image_hint and image_hint not in cache.images:
+                        prefetch = IMAGE_EXECUTOR.submit(self._cached_image, cache, image_hint)
+
+                    article = Article(entry_data.link, keep_article_html=True)
+                    article.download(input_html=self._download_html(entry_data.link))
+                    article.parse()
+
+                    # get images
+                    # an empty URL when neither the article nor the feed has an image
+                    top_image_url = article.top_image or image_hint or ""
+                    if prefetch and top_image_url == image_hint:
+                        image = prefetch.result()
+                    elif top_image_url:
+                        image = self._cached_image(cache, top_image_url)
+                    else:
+                        image = None
+
+                    feed_entry = Entry(self, article, entry_data,
+                                  top_image_url, image, self._icon, now)
+                except BaseException:
+                    # a feed waiting for the same link will try to download it instead
+                    cache.release(entry_data.link)
+                    raise
+                finally:
+                    # the prefetched image is not needed if it wasn't used, or the article failed to download
+                    if prefetch:
+                        prefetch.cancel()
+                cache.put_used(entry_data.link, feed_entry)
                 logging.info(f"cached entry {feed_entry.link}")
+            return feed_entry
+
+        def entry_downloaded(future: Future):
+            """Add a downloaded entry to the current batch, or log why it failed to download."""
+            try:
+                feed_entry = future.result()
+            except Exception as e:
+                logging.error(f"Failed to download entry from {self._url}: {e}")
+                return
             self._entries.append(feed_entry)
-            queue.put(feed_entry)
+            batcher.add(feed_entry)
+
+        # feeds can list the same link more than once, it is only downloaded once
+        links = set()
+        for entry_data in self._feed.entries:
+            link = entry_data.get("link")
+            if link in links:
+                continue
+            links.add(link)
+            EXECUTOR.submit(download_entry, entry_data).add_done_callback(entry_downloaded)
+
+    def _cached_image(self, cache: EntryCache, url: str) -> Optional[bytes]:
+        """
+        Return the top image data for the given URL from the cache, or download, downscale and cache it.
+        Images shared with other entries, such as a feed's hero image, are only downloaded once, even by
+        entries downloading at the same time. This will return `None` if the image cannot be retrieved.
+        """
+        image = cache.get_or_claim_image(url)
+        if image is None:
+            try:
+                image = self._download_image(url)
+                if image:
+                    image = cache.thumbnail(image)
+            finally:
+                cache.put_image(url, image)
+        return image
+
+    def _image_hint(self, entry_data: dict[str, str]) -> Optional[str]:
+        """
+        Return the URL of an image that the feed provides for the given entry item,
+        from its media content, media thumbnails, or image enclosures.
+        This will return `None` if the entry item has no image.
+        """
+        for media in entry_data.get("media_content", []):
+            if media.get("medium") == "image" or media.get("type", "").startswith("image/"):
+                return media.get("url")
+        for thumbnail in entry_data.get("media_thumbnail", []):
+            return thumbnail.get("url")
+        for enclosure in entry_data.get("enclosures", []):
+            if enclosure.get("type", "").startswith("image/"):
+                return enclosure.get("href")
+        return None
+
+    def _download_html(self, url: str):
+        """
+        Return the HTML of the page at the given URL, for a `newspaper.Article` to parse.
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            executor.map(download_entry, self._feed.entries)
+        Like `newspaper`, the raw bytes are returned when the server doesn't declare an encoding,
+        so that the parser can detect it. This will raise a `requests.RequestException` on failure.
+        """
+        with _host_semaphore(url):
+            r = _SESSION.get(url, timeout=_TIMEOUT)
+        r.raise_for_status()
+        # requests falls back to ISO-8859-1 for text without a declared charset
+        return r.content if r.encoding == "ISO-8859-1" else r.text
 
     def _download_image(self, url) -> Optional[bytes]:
         """
         Return raw image data in bytes of the image at the given URL.
         This will return `None` if the image cannot be retrieved.
+        Images larger than `_MAX_IMAGE_BYTES` are not downloaded, and `None` is returned for them.
         """
         try:
-            r = requests.get(url)
-            if r.status_code == 200:
-                return r.content
+            return _fetch_bytes(url, _MAX_IMAGE_BYTES)[0]
         except:
             return None
 
@@ -192,6 +555,9 @@ class FeedList:
     def __getitem__(self, key):
         return self._feeds[key]
 
+    def __len__(self) -> int:
+        return len(self._feeds)
+
     @property
     def feeds(self) -> list[Feed]:
         """A list of every `Feed` in this `FeedList`."""
@@ -200,16 +566,12 @@ class FeedList:
     @property
     def entries(self) -> list[Entry]:
         """Return every `Entry` from each enabled `Feed` in this `FeedList`"""
-        entries = []
-        for feed in self._feeds:
-            if feed.enabled:
-                entries.extend(feed.entries)
-        return entries
+        return list(chain.from_iterable(feed.entries for feed in self._feeds if feed.enabled))
 
     @property
     def len(self) -> int:
-        """The number of feeds in this `FeedList`"""
-        return len(self._feeds)
+        """The number of feeds in this `FeedList`. Kept for existing callers, `len(feed_list)` is preferred."""
+        return len(self)
 
     def append(self, feed: Feed) -> None:
         """Append the given `Feed` to this `FeedList`."""
@@ -227,7 +589,7 @@ class FeedList:
         """
         try:
             Path(path).parent.mkdir(exist_ok=True, parents=True)
-            with open(path, "w+") as json_file:
+            with open(path, "wb") as json_file:
                 feed_json = []
                 for feed in self._feeds:
                     saved_state = {
@@ -236,29 +598,33 @@ class FeedList:
                         "enabled": feed.enabled
                     }
                     feed_json.append(saved_state)
-                json.dump(feed_json, json_file)
+                json_file.write(orjson.dumps(feed_json))
         except OSError as e:
             logging.error(f"Error while saving feed list to {path}: {e}")
             raise
 
-    def load(self, path: str, queue: Queue, cache: EntryCache):
+    def load(self, path: str, queue: SimpleQueue, cache: EntryCache):
         """
         Load this `FeedList` with every `Feed` parsed from the given JSON file.
 
         Any feeds that cannot be parsed from the file will not be added to the list of feeds.
 
-        The given `Queue` object will be passed to each created `Feed` object to allow
+        The given queue will be passed to each created `Feed` object to allow
         access to entries that have finished downloading.
         """
         try:
-            with open(path, "r+") as json_file:
+            with open(path, "rb") as json_file:
+                feeds_data = orjson.loads(json_file.read())
+            # every feed is parsed at once on the shared executor, in the order they were saved
+            feeds = [Feed(data["url"].rstrip(), queue, cache, display=data["display"], enabled=data["enabled"],
+                          bootstrap=False) for data in feeds_data]
+            futures = [EXECUTOR.submit(feed.bootstrap) for feed in feeds]
+            for future in futures:
                 try:
-                    feeds_data = json.load(json_file)
-                    for data in feeds_data:
-                        feed = Feed(data["url"].rstrip(), queue, cache, display=data["display"], enabled=data["enabled"])
-                        self.append(feed)
-                        logging.info(
-                            f"Added feed from {feed.url}")
+                    feed = future.result()
+                    self.append(feed)
+                    logging.info(
+                        f"Added feed from {feed.url}")
                 except FeedParseError as e:
                     logging.error(f"Error while processing feed: {e}")
 